@@ -1,5 +1,5 @@
-from .handlers import (block, broadcast, condition, do, enum, escape, infer_config, lift, markov, mask, queue, replay,
-                       scale, seed, trace, uncondition)
+from .handlers import (block, broadcast, condition, condition_batch, do, enum, escape, infer_config, lift, markov, mask,
+                       queue, replay, scale, seed, trace, uncondition)
 from .runtime import NonlocalExit
 from .trace_struct import Trace
 from .util import enable_validation, is_validation_enabled
@@ -8,6 +8,7 @@ __all__ = [
     "block",
     "broadcast",
     "condition",
+    "condition_batch",
     "do",
     "enable_validation",
     "enum",
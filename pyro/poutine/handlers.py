@@ -46,9 +46,6 @@ in just a few lines of code::
     monte_carlo_elbo = model_tr.log_prob_sum() - guide_tr.log_prob_sum()
 """
 
-import functools
-import re
-
 from pyro.poutine import util
 
 from .block_messenger import BlockMessenger
@@ -67,32 +64,35 @@ from .runtime import NonlocalExit
 from .scale_messenger import ScaleMessenger
 from .seed_messenger import SeedMessenger
 from .trace_messenger import TraceMessenger
+from .trace_struct import Trace
 from .uncondition_messenger import UnconditionMessenger
 
+__all__ = [
+    "block",
+    "broadcast",
+    "condition",
+    "condition_batch",
+    "do",
+    "enum",
+    "escape",
+    "infer_config",
+    "lift",
+    "markov",
+    "mask",
+    "queue",
+    "replay",
+    "scale",
+    "seed",
+    "trace",
+    "uncondition",
+]
+
 ############################################
 # Begin primitive operations
 ############################################
 
-_msngrs = [
-    BlockMessenger,
-    BroadcastMessenger,
-    ConditionMessenger,
-    DoMessenger,
-    EnumMessenger,
-    EscapeMessenger,
-    InferConfigMessenger,
-    LiftMessenger,
-    MarkovMessenger,
-    MaskMessenger,
-    ReplayMessenger,
-    ScaleMessenger,
-    SeedMessenger,
-    TraceMessenger,
-    UnconditionMessenger,
-]
-
 
-def _make_handler(msngr_cls):
+def _make_handler(msngr_cls, name):
 
     def handler(fn=None, *args, **kwargs):
         if fn is not None and not callable(fn):
@@ -101,26 +101,48 @@ def _make_handler(msngr_cls):
         msngr = msngr_cls(*args, **kwargs)
         return msngr(fn) if fn is not None else msngr
 
+    handler.__module__ = __name__
+    handler.__doc__ = """Convenient wrapper of :class:`~pyro.poutine.{}.{}` \n\n""".format(
+        name + "_messenger", msngr_cls.__name__) + msngr_cls.__doc__
+    handler.__name__ = name
     return handler
 
 
-_re1 = re.compile('(.)([A-Z][a-z]+)')
-_re2 = re.compile('([a-z0-9])([A-Z])')
-for _msngr_cls in _msngrs:
-    _handler_name = _re2.sub(
-        r'\1_\2', _re1.sub(r'\1_\2', _msngr_cls.__name__.split("Messenger")[0])).lower()
-    _handler = _make_handler(_msngr_cls)
-    _handler.__module__ = __name__
-    _handler.__doc__ = """Convenient wrapper of :class:`~pyro.poutine.{}.{}` \n\n""".format(
-        _handler_name + "_messenger", _msngr_cls.__name__) + _msngr_cls.__doc__
-    _handler.__name__ = _handler_name
-    locals()[_handler_name] = _handler
+block = _make_handler(BlockMessenger, "block")
+broadcast = _make_handler(BroadcastMessenger, "broadcast")
+condition = _make_handler(ConditionMessenger, "condition")
+do = _make_handler(DoMessenger, "do")
+enum = _make_handler(EnumMessenger, "enum")
+escape = _make_handler(EscapeMessenger, "escape")
+infer_config = _make_handler(InferConfigMessenger, "infer_config")
+lift = _make_handler(LiftMessenger, "lift")
+mask = _make_handler(MaskMessenger, "mask")
+replay = _make_handler(ReplayMessenger, "replay")
+scale = _make_handler(ScaleMessenger, "scale")
+seed = _make_handler(SeedMessenger, "seed")
+trace = _make_handler(TraceMessenger, "trace")
+uncondition = _make_handler(UnconditionMessenger, "uncondition")
 
 
 #########################################
 # Begin composite operations
 #########################################
 
+class _BoundEscapeFn(object):
+    """
+    Binds the partial trace argument of an ``escape_fn``.
+    Unlike :func:`functools.partial`, the trace can be rebound in place.
+    """
+    __slots__ = ("escape_fn", "trace")
+
+    def __init__(self, escape_fn):
+        self.escape_fn = escape_fn
+        self.trace = None
+
+    def __call__(self, msg):
+        return self.escape_fn(self.trace, msg)
+
+
 def queue(fn=None, queue=None, max_tries=None,
           extend_fn=None, escape_fn=None, num_samples=None):
     """
@@ -130,7 +152,9 @@ def queue(fn=None, queue=None, max_tries=None,
     return a return value from a complete trace in the queue.
 
     :param fn: a stochastic function (callable containing Pyro primitive calls)
-    :param queue: a queue data structure like multiprocessing.Queue to hold partial traces
+    :param queue: a queue data structure to hold partial traces, e.g. an in-process
+        :class:`queue.Queue` or :class:`queue.LifoQueue`. A :class:`multiprocessing.Queue`
+        also works but pickles every partial trace on ``put()`` and ``get()``.
     :param max_tries: maximum number of attempts to compute a single complete trace
     :param extend_fn: function (possibly stochastic) that takes a partial trace and a site,
         and returns a list of extended traces
@@ -154,20 +178,28 @@ def queue(fn=None, queue=None, max_tries=None,
 
     def wrapper(wrapped):
         def _fn(*args, **kwargs):
+            # build the handler stack once per call and retarget it at each
+            # partial trace, rather than rebuilding it on every try
+            replay_msngr = ReplayMessenger(trace=Trace())
+            bound_escape_fn = _BoundEscapeFn(escape_fn)
+            escape_msngr = EscapeMessenger(escape_fn=bound_escape_fn)
+            ftr = trace(escape_msngr(replay_msngr(wrapped)))
 
             for i in range(max_tries):
-                assert not queue.empty(), \
-                    "trying to get() from an empty queue will deadlock"
+                # explicit check rather than an assert, which python -O would strip
+                if queue.empty():
+                    raise AssertionError("trying to get() from an empty queue will deadlock")
 
                 next_trace = queue.get()
+                replay_msngr.trace = next_trace
+                bound_escape_fn.trace = next_trace
                 try:
-                    ftr = trace(escape(replay(wrapped, trace=next_trace),  # noqa: F821
-                                       escape_fn=functools.partial(escape_fn,
-                                                                   next_trace)))
                     return ftr(*args, **kwargs)
                 except NonlocalExit as site_container:
                     site_container.reset_stack()
-                    for tr in extend_fn(ftr.trace.copy(), site_container.site,
+                    # the next try records into a fresh Trace, so extend_fn
+                    # can take ownership of this one without a copy
+                    for tr in extend_fn(ftr.trace, site_container.site,
                                         num_samples=num_samples):
                         queue.put(tr)
 
@@ -177,6 +209,28 @@ def queue(fn=None, queue=None, max_tries=None,
     return wrapper(fn) if fn is not None else wrapper
 
 
+def condition_batch(fn=None, datas=()):
+    """
+    Conditions on several dicts of observations with a single
+    :class:`~pyro.poutine.condition_messenger.ConditionMessenger`.
+
+    ``condition_batch(fn, datas=[data1, data2])`` is equivalent to
+    ``condition(condition(fn, data=data1), data=data2)``:
+    where dicts share a site name, later dicts take precedence.
+    The dicts are merged once, so each sample site is handled by one
+    messenger rather than one per dict.
+
+    :param fn: a stochastic function (callable containing Pyro primitive calls)
+    :param datas: an iterable of dicts mapping site names to observed values
+    :returns: stochastic function decorated with a
+        :class:`~pyro.poutine.condition_messenger.ConditionMessenger`
+    """
+    data = {}
+    for d in datas:
+        data.update(d)
+    return condition(fn, data=data)
+
+
 def markov(fn=None, history=1, keep=False, dim=None, name=None):
     """
     Markov dependency declaration.
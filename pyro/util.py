@@ -11,6 +11,11 @@ from contextlib import contextmanager
 
 from pyro.poutine.util import site_is_subsample
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def set_rng_seed(rng_seed):
     """
@@ -20,20 +25,14 @@ def set_rng_seed(rng_seed):
     """
     torch.manual_seed(rng_seed)
     random.seed(rng_seed)
-    try:
-        import numpy as np
+    if np is not None:
         np.random.seed(rng_seed)
-    except ImportError:
-        pass
 
 
 def get_rng_state():
     state = {'torch': torch.get_rng_state(), 'random': random.getstate()}
-    try:
-        import numpy as np
+    if np is not None:
         state['numpy'] = np.random.get_state()
-    except ImportError:
-        pass
     return state
 
 
@@ -41,7 +40,6 @@ def set_rng_state(state):
     torch.set_rng_state(state['torch'])
     random.setstate(state['random'])
     if 'numpy' in state:
-        import numpy as np
         np.random.set_state(state['numpy'])
 
 
@@ -273,6 +273,11 @@ class QueueHandlerDiscreteTest(TestCase):
         with pytest.raises(ValueError):
             f()
 
+    def test_queue_empty(self):
+        f = poutine.queue(self.model, queue=Queue())
+        with pytest.raises(AssertionError, match="empty queue"):
+            f()
+
 
 class Model(nn.Module):
     def __init__(self):
@@ -550,6 +555,18 @@ class ConditionHandlerTests(NormalNormalNormalHandlerTestCase):
             tr.nodes["latent2"]["is_observed"]
         assert tr.nodes["latent2"]["value"] is data2["latent2"]
 
+    def test_condition_batch(self):
+        data1 = {"latent1": torch.randn(2), "latent2": torch.randn(2)}
+        data2 = {"latent2": torch.randn(2)}
+        tr = poutine.trace(
+            poutine.condition_batch(self.model, datas=[data1, data2])).get_trace()
+        assert tr.nodes["latent1"]["type"] == "sample" and \
+            tr.nodes["latent1"]["is_observed"]
+        assert tr.nodes["latent1"]["value"] is data1["latent1"]
+        assert tr.nodes["latent2"]["type"] == "sample" and \
+            tr.nodes["latent2"]["is_observed"]
+        assert tr.nodes["latent2"]["value"] is data2["latent2"]
+
 
 class UnconditionHandlerTests(NormalNormalNormalHandlerTestCase):
 